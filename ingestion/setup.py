@@ -237,6 +237,9 @@ plugins: Dict[str, Set[str]] = {
     "pii-processor": pii_requirements,
 }
 
+# Plugins not installed as part of the `all` extra
+all_excluded_plugins = {"airflow", "db2", "great-expectations"}
+
 dev = {
     "black==22.3.0",
     "datamodel-code-generator==0.15.0",
@@ -299,16 +302,11 @@ setup(
         **{plugin: list(dependencies) for (plugin, dependencies) in plugins.items()},
         "all": list(
             base_requirements.union(
-                *[
+                *(
                     requirements
                     for plugin, requirements in plugins.items()
-                    if plugin
-                    not in {
-                        "airflow",
-                        "db2",
-                        "great-expectations",
-                    }
-                ]
+                    if plugin not in all_excluded_plugins
+                )
             )
         ),
     },
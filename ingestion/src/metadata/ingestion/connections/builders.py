@@ -96,6 +96,16 @@ def get_connection_options_dict(connection) -> Optional[Dict[str, Any]]:
     )
 
 
+def get_connection_options_params(options: Dict[str, Any]) -> str:
+    """
+    Given the connection options, returns them as
+    url query parameters, skipping the empty values
+    """
+    return "&".join(
+        f"{key}={quote_plus(value)}" for (key, value) in options.items() if value
+    )
+
+
 def init_empty_connection_arguments() -> ConnectionArguments:
     """
     Initialize a ConnectionArguments model with an empty dictionary.
@@ -122,11 +132,10 @@ def init_empty_connection_options() -> ConnectionOptions:
     return ConnectionOptions(__root__={})
 
 
-def _add_password(url: str, connection) -> str:
+def _get_password(connection) -> str:
     """
-    A helper function that adds the password to the url if it exists.
-    Distinguishing between BasicAuth (Password) and IamAuth (AWSConfig)
-    and adding to url.
+    A helper function that returns the password to add to the url.
+    Distinguishing between BasicAuth (Password) and IamAuth (AWSConfig).
     """
     password = getattr(connection, BUILDER_PASSWORD_ATTR, None)
 
@@ -152,8 +161,7 @@ def _add_password(url: str, connection) -> str:
                         Region=connection.authType.awsConfig.awsRegion,
                     )
                 )
-    url += f":{quote_plus(password.get_secret_value())}"
-    return url
+    return password.get_secret_value()
 
 
 def get_connection_url_common(connection) -> str:
@@ -161,28 +169,32 @@ def get_connection_url_common(connection) -> str:
     Common method for building the source connection urls
     """
 
-    url = f"{connection.scheme.value}://"
+    parts = [connection.scheme.value, "://"]
 
     if connection.username:
-        url += f"{quote_plus(connection.username)}"
-        url = _add_password(url, connection)
-        url += "@"
+        parts.extend(
+            (
+                quote_plus(connection.username),
+                ":",
+                quote_plus(_get_password(connection)),
+                "@",
+            )
+        )
 
-    url += connection.hostPort
+    parts.append(connection.hostPort)
     if hasattr(connection, "database"):
-        url += f"/{connection.database}" if connection.database else ""
+        if connection.database:
+            parts.extend(("/", connection.database))
 
     elif hasattr(connection, "databaseSchema"):
-        url += f"/{connection.databaseSchema}" if connection.databaseSchema else ""
+        if connection.databaseSchema:
+            parts.extend(("/", connection.databaseSchema))
 
     options = get_connection_options_dict(connection)
     if options:
         if (hasattr(connection, "database") and not connection.database) or (
             hasattr(connection, "databaseSchema") and not connection.databaseSchema
         ):
-            url += "/"
-        params = "&".join(
-            f"{key}={quote_plus(value)}" for (key, value) in options.items() if value
-        )
-        url = f"{url}?{params}"
-    return url
+            parts.append("/")
+        parts.extend(("?", get_connection_options_params(options)))
+    return "".join(parts)
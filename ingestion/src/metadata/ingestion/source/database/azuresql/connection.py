@@ -30,6 +30,7 @@ from metadata.ingestion.connections.builders import (
     create_generic_db_connection,
     get_connection_args_common,
     get_connection_options_dict,
+    get_connection_options_params,
 )
 from metadata.ingestion.connections.test_connections import test_connection_db_common
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
@@ -40,30 +41,29 @@ def get_connection_url(connection: Union[AzureSQLConnection, MssqlConnection]) -
     Build the connection URL
     """
 
-    url = f"{connection.scheme.value}://"
+    parts = [connection.scheme.value, "://"]
 
     if connection.username:
-        url += f"{quote_plus(connection.username)}"
-        url += (
-            f":{quote_plus(connection.password.get_secret_value())}"
-            if connection
-            else ""
+        parts.extend(
+            (
+                quote_plus(connection.username),
+                ":",
+                quote_plus(connection.password.get_secret_value()),
+                "@",
+            )
         )
-        url += "@"
 
-    url += f"{connection.hostPort}"
-    url += f"/{quote_plus(connection.database)}" if connection.database else ""
-    url += f"?driver={quote_plus(connection.driver)}"
+    parts.append(connection.hostPort)
+    if connection.database:
+        parts.extend(("/", quote_plus(connection.database)))
+    parts.extend(("?driver=", quote_plus(connection.driver)))
     options = get_connection_options_dict(connection)
     if options:
         if not connection.database:
-            url += "/"
-        params = "&".join(
-            f"{key}={quote_plus(value)}" for (key, value) in options.items() if value
-        )
-        url = f"{url}?{params}"
+            parts.append("/")
+        parts.extend(("?", get_connection_options_params(options)))
 
-    return url
+    return "".join(parts)
 
 
 def get_connection(connection: AzureSQLConnection) -> Engine:
@@ -15,7 +15,6 @@ Clickhouse usage module
 import ast
 import traceback
 from abc import ABC
-from datetime import datetime
 from typing import List
 
 from metadata.generated.schema.entity.data.database import Database
@@ -50,6 +49,28 @@ class ClickhouseQueryParserSource(QueryParserSource, ABC):
             )
         return cls(config, metadata_config)
 
+    @staticmethod
+    def _parse_schema_list(schema_names: str) -> List[str]:
+        """
+        `databases` arrives as the string representation of
+        an array, e.g. `['schema']`. This runs for every query log
+        row, so handle the empty and single element arrays directly
+        and only fall back to `ast.literal_eval` for anything else,
+        including escaped names.
+        """
+        inner = schema_names.strip()[1:-1].strip()
+        if not inner:
+            return []
+        quote = inner[0]
+        if (
+            quote in ("'", '"')
+            and inner[-1] == quote
+            and inner.count(quote) == 2
+            and "\\" not in inner
+        ):
+            return [inner[1:-1]]
+        return ast.literal_eval(schema_names)
+
     @staticmethod
     def get_schema_name(data: dict) -> str:
         """
@@ -59,7 +80,9 @@ class ClickhouseQueryParserSource(QueryParserSource, ABC):
             if data.get("schema_name"):
                 schema_list = []
                 if isinstance(data["schema_name"], str):
-                    schema_list = ast.literal_eval(data["schema_name"])
+                    schema_list = ClickhouseQueryParserSource._parse_schema_list(
+                        data["schema_name"]
+                    )
                 elif isinstance(data["schema_name"], list):
                     schema_list = data["schema_name"]
                 schema = schema_list[0] if len(schema_list) == 1 else None
@@ -69,17 +92,6 @@ class ClickhouseQueryParserSource(QueryParserSource, ABC):
             logger.debug(f"Failed to fetch the schema name due to: {exc}")
         return None
 
-    def get_sql_statement(self, start_time: datetime, end_time: datetime) -> str:
-        """
-        returns sql statement to fetch query logs
-        """
-        return self.sql_stmt.format(
-            start_time=start_time,
-            end_time=end_time,
-            filters=self.filters,  # pylint: disable=no-member
-            result_limit=self.source_config.resultLimit,
-        )
-
     def prepare(self):
         """
         Fetch queries only from DB that is ingested in OM
@@ -79,11 +79,10 @@ class LineageSource(QueryParserSource, ABC):
         yield a TableQuery with query parsing info
         """
         with self.engine.connect() as conn:
-            rows = conn.execute(
-                self.get_sql_statement(
-                    start_time=self.start,
-                    end_time=self.end,
-                )
+            rows = self.fetch_query_log(
+                conn,
+                start_time=self.start,
+                end_time=self.end,
             )
             for row in rows:
                 query_dict = dict(row)
@@ -97,8 +97,7 @@ class MssqlSource(CommonDbSourceService):
                 "SELECT name FROM master.sys.databases order by name"
             )
             for res in results:
-                row = list(res)
-                new_database = row[0]
+                new_database = res[0]
                 database_fqn = fqn.build(
                     self.metadata,
                     entity_type=Database,
@@ -155,8 +155,7 @@ class PostgresSource(CommonDbSourceService):
         else:
             results = self.connection.execute(POSTGRES_GET_DB_NAMES)
             for res in results:
-                row = list(res)
-                new_database = row[0]
+                new_database = res[0]
                 database_fqn = fqn.build(
                     self.metadata,
                     entity_type=Database,
@@ -212,13 +211,12 @@ class PostgresSource(CommonDbSourceService):
                 )
             ).all()
             for res in result:
-                row = list(res)
-                fqn_elements = [name for name in row[2:] if name]
+                fqn_elements = [name for name in res[2:] if name]
                 yield from get_ometa_tag_and_classification(
                     tag_fqn=fqn._build(  # pylint: disable=protected-access
                         self.context.database_service.name.__root__, *fqn_elements
                     ),
-                    tags=[row[1]],
+                    tags=[res[1]],
                     classification_name=self.service_connection.classificationName,
                     tag_description="Postgres Tag Value",
                     classification_desciption="Postgres Tag Name",
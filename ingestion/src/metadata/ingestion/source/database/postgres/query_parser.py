@@ -157,9 +157,11 @@ class PostgresQueryParserSource(QueryParserSource, ABC):
                 else:
                     results = self.engine.execute(POSTGRES_GET_DATABASE)
                     for res in results:
-                        row = list(res)
-                        logger.info(f"Ingesting from database: {row[0]}")
-                        self.config.serviceConnection.__root__.config.database = row[0]
+                        database_name = res[0]
+                        logger.info(f"Ingesting from database: {database_name}")
+                        self.config.serviceConnection.__root__.config.database = (
+                            database_name
+                        )
                         self.engine = get_connection(self.service_connection)
                         yield from self.process_table_query()
 
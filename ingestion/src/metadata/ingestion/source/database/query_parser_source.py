@@ -13,7 +13,10 @@ Usage Souce Module
 """
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Iterator, Optional, Union
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Union
+
+from sqlalchemy.engine import Connection, Row
 
 from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
@@ -100,13 +103,47 @@ class QueryParserSource(Source[Union[TableQuery, AddLineageRequest]], ABC):
 
         Override if we have specific parameters
         """
-        return self.sql_stmt.format(
+        return self.format_sql_statement(
+            sql_stmt=self.sql_stmt,
             start_time=start_time,
             end_time=end_time,
             filters=self.filters,
             result_limit=self.source_config.resultLimit,
         )
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def format_sql_statement(
+        sql_stmt: str,
+        start_time: datetime,
+        end_time: datetime,
+        filters: str,
+        result_limit: int,
+    ) -> str:
+        """
+        Format the query log statement. Sources can be
+        instantiated several times for the same time window,
+        so we keep the latest statements around.
+        """
+        return sql_stmt.format(
+            start_time=start_time,
+            end_time=end_time,
+            filters=filters,
+            result_limit=result_limit,
+        )
+
+    def fetch_query_log(
+        self, conn: Connection, start_time: datetime, end_time: datetime
+    ) -> Iterable[Row]:
+        """
+        Execute the query log statement and return its rows.
+
+        Override if the source needs a specific way of fetching them
+        """
+        return conn.execute(
+            self.get_sql_statement(start_time=start_time, end_time=end_time)
+        )
+
     def close(self):
         """
         By default, there is nothing to close
@@ -146,8 +146,7 @@ class RedshiftSource(CommonDbSourceService):
         else:
             results = self.connection.execute(REDSHIFT_GET_DATABASE_NAMES)
             for res in results:
-                row = list(res)
-                new_database = row[0]
+                new_database = res[0]
                 database_fqn = fqn.build(
                     self.metadata,
                     entity_type=Database,
@@ -32,6 +32,7 @@ from metadata.ingestion.connections.builders import (
     create_generic_db_connection,
     get_connection_args_common,
     get_connection_options_dict,
+    get_connection_options_params,
     init_empty_connection_arguments,
 )
 from metadata.ingestion.connections.test_connections import (
@@ -59,30 +60,29 @@ def get_connection_url(connection: SnowflakeConnection) -> str:
     """
     Set the connection URL
     """
-    url = f"{connection.scheme.value}://"
+    parts = [connection.scheme.value, "://"]
 
     if connection.username:
-        url += f"{quote_plus(connection.username)}"
         if not connection.password:
             connection.password = SecretStr("")
-        url += (
-            f":{quote_plus(connection.password.get_secret_value())}"
-            if connection
-            else ""
+        parts.extend(
+            (
+                quote_plus(connection.username),
+                ":",
+                quote_plus(connection.password.get_secret_value()),
+                "@",
+            )
         )
-        url += "@"
 
-    url += connection.account
-    url += f"/{connection.database}" if connection.database else ""
+    parts.append(connection.account)
+    if connection.database:
+        parts.extend(("/", connection.database))
 
     options = get_connection_options_dict(connection)
     if options:
         if not connection.database:
-            url += "/"
-        params = "&".join(
-            f"{key}={quote_plus(value)}" for (key, value) in options.items() if value
-        )
-        url = f"{url}?{params}"
+            parts.append("/")
+        parts.extend(("?", get_connection_options_params(options)))
     options = {
         "account": connection.account,
         "warehouse": connection.warehouse,
@@ -90,8 +90,8 @@ def get_connection_url(connection: SnowflakeConnection) -> str:
     }
     params = "&".join(f"{key}={value}" for (key, value) in options.items() if value)
     if params:
-        url = f"{url}?{params}"
-    return url
+        parts.extend(("?", params))
+    return "".join(parts)
 
 
 def get_connection(connection: SnowflakeConnection) -> Engine:
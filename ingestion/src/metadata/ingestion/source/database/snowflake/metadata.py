@@ -172,8 +172,7 @@ class SnowflakeSource(CommonDbSourceService):
         else:
             results = self.connection.execute(SNOWFLAKE_GET_DATABASES)
             for res in results:
-                row = list(res)
-                new_database = row[1]
+                new_database = res[1]
                 database_fqn = fqn.build(
                     self.metadata,
                     entity_type=Database,
@@ -294,14 +293,13 @@ class SnowflakeSource(CommonDbSourceService):
                     logger.error(f"Failed to fetch tags: {inner_exc}")
 
             for res in result:
-                row = list(res)
-                fqn_elements = [name for name in row[2:] if name]
+                fqn_elements = [name for name in res[2:] if name]
                 yield from get_ometa_tag_and_classification(
                     tag_fqn=fqn._build(  # pylint: disable=protected-access
                         self.context.database_service.name.__root__, *fqn_elements
                     ),
-                    tags=[row[1]],
-                    classification_name=row[0],
+                    tags=[res[1]],
+                    classification_name=res[0],
                     tag_description="SNOWFLAKE TAG VALUE",
                     classification_desciption="SNOWFLAKE TAG NAME",
                 )
@@ -13,7 +13,9 @@ Snowflake Query parser module
 """
 from abc import ABC
 from datetime import datetime
-from typing import Iterable
+from typing import Iterable, Iterator
+
+from sqlalchemy.engine import Connection, Row
 
 from metadata.generated.schema.entity.services.connections.database.snowflakeConnection import (
     SnowflakeConnection,
@@ -26,7 +28,6 @@ from metadata.generated.schema.metadataIngestion.workflow import (
 )
 from metadata.generated.schema.type.tableQuery import TableQuery
 from metadata.ingestion.api.source import InvalidSourceException
-from metadata.ingestion.source.connections import get_connection
 from metadata.ingestion.source.database.query_parser_source import QueryParserSource
 from metadata.ingestion.source.database.snowflake.queries import (
     SNOWFLAKE_SESSION_TAG_QUERY,
@@ -35,6 +36,7 @@ from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
 SNOWFLAKE_ABORTED_CODE = "1969"
+SNOWFLAKE_QUERY_LOG_FETCH_SIZE = 5000
 
 
 class SnowflakeQueryParserSource(QueryParserSource, ABC):
@@ -52,17 +54,6 @@ class SnowflakeQueryParserSource(QueryParserSource, ABC):
             )
         return cls(config, metadata_config)
 
-    def get_sql_statement(self, start_time: datetime, end_time: datetime) -> str:
-        """
-        returns sql statement to fetch query logs
-        """
-        return self.sql_stmt.format(
-            start_time=start_time,
-            end_time=end_time,
-            result_limit=self.config.sourceConfig.config.resultLimit,
-            filters=self.filters,
-        )
-
     def set_session_query_tag(self) -> None:
         """
         Method to set query tag for current session
@@ -74,25 +65,32 @@ class SnowflakeQueryParserSource(QueryParserSource, ABC):
                 )
             )
 
+    def fetch_query_log(
+        self, conn: Connection, start_time: datetime, end_time: datetime
+    ) -> Iterator[Row]:
+        """
+        Stream the query history rows, fetching them from
+        the driver in batches instead of one at a time
+        """
+        rows = conn.execution_options(stream_results=True).execute(
+            self.get_sql_statement(start_time=start_time, end_time=end_time)
+        )
+        while True:
+            batch = rows.fetchmany(SNOWFLAKE_QUERY_LOG_FETCH_SIZE)
+            if not batch:
+                break
+            yield from batch
+
     def get_table_query(self) -> Iterable[TableQuery]:
         database = self.config.serviceConnection.__root__.config.database
         if database:
             use_db_query = f"USE DATABASE {database}"
             self.engine.execute(use_db_query)
-            self.set_session_query_tag()
-            yield from super().get_table_query()
-        else:
-            query = "SHOW DATABASES"
-            results = self.engine.execute(query)
-            for res in results:
-                row = list(res)
-                use_db_query = f"USE DATABASE {row[1]}"
-                self.engine.execute(use_db_query)
-                logger.info(f"Ingesting from database: {row[1]}")
-                self.config.serviceConnection.__root__.config.database = row[1]
-                self.engine = get_connection(self.service_connection)
-                self.set_session_query_tag()
-                yield from super().get_table_query()
+        # QUERY_HISTORY lives in the account-wide SNOWFLAKE database and already
+        # exposes the database_name, so a single query fetches the usage of
+        # every database, including queries run without a current database
+        self.set_session_query_tag()
+        yield from super().get_table_query()
 
     def get_database_name(self, data: dict) -> str:  # pylint: disable=arguments-differ
         """
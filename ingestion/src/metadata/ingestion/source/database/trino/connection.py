@@ -27,6 +27,7 @@ from metadata.generated.schema.entity.services.connections.database.trinoConnect
 from metadata.ingestion.connections.builders import (
     create_generic_db_connection,
     get_connection_args_common,
+    get_connection_options_params,
     init_empty_connection_arguments,
 )
 from metadata.ingestion.connections.secrets import connection_with_options_secrets
@@ -48,12 +49,7 @@ def get_connection_url(connection: TrinoConnection) -> str:
     if connection.catalog:
         url += f"/{connection.catalog}"
     if connection.params is not None:
-        params = "&".join(
-            f"{key}={quote_plus(value)}"
-            for (key, value) in connection.params.items()
-            if value
-        )
-        url = f"{url}?{params}"
+        url = f"{url}?{get_connection_options_params(connection.params)}"
     return url
 
 
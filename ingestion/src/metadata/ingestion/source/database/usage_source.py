@@ -91,11 +91,10 @@ class UsageSource(QueryParserSource, ABC):
             )
             try:
                 with self.engine.connect() as conn:
-                    rows = conn.execute(
-                        self.get_sql_statement(
-                            start_time=self.start + timedelta(days=days),
-                            end_time=self.start + timedelta(days=days + 1),
-                        )
+                    rows = self.fetch_query_log(
+                        conn,
+                        start_time=self.start + timedelta(days=days),
+                        end_time=self.start + timedelta(days=days + 1),
                     )
                     queries = []
                     for row in rows:
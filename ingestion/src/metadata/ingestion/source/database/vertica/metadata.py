@@ -303,8 +303,7 @@ class VerticaSource(CommonDbSourceService):
         else:
             results = self.connection.execute(VERTICA_LIST_DATABASES)
             for res in results:
-                row = list(res)
-                new_database = row[0]
+                new_database = res[0]
                 database_fqn = fqn.build(
                     self.metadata,
                     entity_type=Database,
@@ -62,8 +62,8 @@ class VerticaQueryParserSource(QueryParserSource, ABC):
         else:
             results = self.engine.execute(VERTICA_LIST_DATABASES)
             for res in results:
-                row = list(res)
-                logger.info(f"Ingesting from database: {row[0]}")
-                self.config.serviceConnection.__root__.config.database = row[0]
+                database_name = res[0]
+                logger.info(f"Ingesting from database: {database_name}")
+                self.config.serviceConnection.__root__.config.database = database_name
                 self.engine = get_connection(self.service_connection)
                 yield from super().get_table_query()
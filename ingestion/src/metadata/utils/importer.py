@@ -14,6 +14,7 @@ Helpers to import python classes and modules dynamically
 import importlib
 import traceback
 from enum import Enum
+from functools import lru_cache
 from typing import Callable, Optional, Type, TypeVar
 
 from pydantic import BaseModel
@@ -181,9 +182,28 @@ def get_sink(
     return sink
 
 
+@lru_cache(maxsize=None)
+def get_connection_module(connection_type: str) -> str:
+    """
+    Build the connection module path of a connection type, e.g.,
+    Mysql -> metadata.ingestion.source.database.mysql.connection
+    """
+    service_type: ServiceType = get_service_type_from_source_type(connection_type)
+
+    # module building strings read better with .format instead of f-strings
+    # pylint: disable=consider-using-f-string
+    return "metadata.ingestion.source.{}.{}.connection".format(
+        service_type.name.lower(),
+        connection_type.lower(),
+    )
+
+
 def import_connection_fn(connection: BaseModel, function_name: str) -> Callable:
     """
-    Import get_connection and test_connection from sources
+    Import get_connection and test_connection from sources.
+
+    Only the module path is cached, the function is looked up at
+    call time so that patching it keeps working.
     """
     if not isinstance(connection, BaseModel):
         raise ValueError(
@@ -196,15 +216,9 @@ def import_connection_fn(connection: BaseModel, function_name: str) -> Callable:
             f"Cannot get `type` property from connection {connection}. Check the JSON Schema."
         )
 
-    service_type: ServiceType = get_service_type_from_source_type(connection_type.value)
-
-    # module building strings read better with .format instead of f-strings
-    # pylint: disable=consider-using-f-string
     _connection_fn = import_from_module(
-        "metadata.ingestion.source.{}.{}.connection.{}".format(
-            service_type.name.lower(),
-            connection_type.value.lower(),
-            function_name,
+        MODULE_SEPARATOR.join(
+            (get_connection_module(connection_type.value), function_name)
         )
     )
 
@@ -13,6 +13,7 @@
 Test import utilities
 """
 from unittest import TestCase
+from unittest.mock import patch
 
 from metadata.generated.schema.entity.services.connections.database.mysqlConnection import (
     MysqlConnection,
@@ -21,6 +22,7 @@ from metadata.generated.schema.entity.services.serviceType import ServiceType
 from metadata.utils.importer import (
     DynamicImportException,
     get_class_name_root,
+    get_connection_module,
     get_module_name,
     get_source_module_name,
     import_bulk_sink_type,
@@ -139,3 +141,34 @@ class ImporterTest(TestCase):
             connection=connection,
             function_name="random",
         )
+
+    def test_import_get_connection_cached(self) -> None:
+        """
+        The module path is cached, but the function
+        is still looked up on every call
+        """
+        connection = MysqlConnection(
+            username="name",
+            hostPort="hostPort",
+        )
+        get_connection_module.cache_clear()
+
+        get_connection_fn = import_connection_fn(
+            connection=connection, function_name="get_connection"
+        )
+        self.assertEqual(
+            import_connection_fn(connection=connection, function_name="get_connection"),
+            get_connection_fn,
+        )
+        self.assertEqual(get_connection_module.cache_info().hits, 1)
+
+        with patch(
+            "metadata.ingestion.source.database.mysql.connection.get_connection"
+        ) as mock_get_connection:
+            self.assertIs(
+                import_connection_fn(
+                    connection=connection, function_name="get_connection"
+                ),
+                mock_get_connection,
+            )
+        self.assertEqual(get_connection_module.cache_info().hits, 2)
@@ -11,9 +11,12 @@
 """
 Deploy the DAG and scan it with the scheduler
 """
+import hashlib
+import threading
 import traceback
 from typing import Callable
 
+import orjson
 from flask import Blueprint, Response, request
 from openmetadata_managed_apis.api.response import ApiResponse
 from openmetadata_managed_apis.operations.deploy import DagDeployer
@@ -23,9 +26,39 @@ from pydantic import ValidationError
 from metadata.generated.schema.entity.services.ingestionPipelines.ingestionPipeline import (
     IngestionPipeline,
 )
+from metadata.utils.lru_cache import LRUCache
 
 logger = routes_logger()
 
+INGESTION_PIPELINE_CACHE_SIZE = 128
+
+# The same pipelines get redeployed often. Keep the already validated
+# models indexed by the hash of the request body they were parsed from.
+ingestion_pipeline_cache = LRUCache(INGESTION_PIPELINE_CACHE_SIZE)
+# The webserver can serve requests from several threads and the LRUCache
+# reorders its entries on every read, so guard each access
+ingestion_pipeline_cache_lock = threading.Lock()
+
+
+def parse_ingestion_pipeline(body: bytes) -> IngestionPipeline:
+    """
+    Parse the request body into an IngestionPipeline,
+    skipping the validation if we already parsed the same body
+    """
+    key = hashlib.blake2b(body, digest_size=16).digest()
+    with ingestion_pipeline_cache_lock:
+        try:
+            return ingestion_pipeline_cache.get(key)
+        except KeyError:
+            pass
+
+    # Parse outside the lock so that a slow validation does not block other requests
+    ingestion_pipeline = IngestionPipeline.parse_obj(orjson.loads(body))
+    with ingestion_pipeline_cache_lock:
+        ingestion_pipeline_cache.put(key, ingestion_pipeline)
+
+    return ingestion_pipeline
+
 
 def get_fn(blueprint: Blueprint) -> Callable:
     """
@@ -52,26 +85,34 @@ def get_fn(blueprint: Blueprint) -> Callable:
         the session
         """
 
-        json_request = request.get_json(cache=False)
+        body = request.get_data(cache=False)
 
         try:
-            if json_request is None:
+            if not body:
                 return ApiResponse.error(
                     status=ApiResponse.STATUS_BAD_REQUEST,
                     error=f"Did not receive any JSON request to deploy",
                 )
 
-            ingestion_pipeline = IngestionPipeline.parse_obj(json_request)
+            ingestion_pipeline = parse_ingestion_pipeline(body)
 
             deployer = DagDeployer(ingestion_pipeline)
             response = deployer.deploy()
 
             return response
 
+        except orjson.JSONDecodeError as err:
+            logger.debug(traceback.format_exc())
+            logger.error(f"Error decoding JSON payload [{body}]: {err}")
+            return ApiResponse.error(
+                status=ApiResponse.STATUS_BAD_REQUEST,
+                error=f"Error decoding JSON payload: {err}",
+            )
+
         except ValidationError as err:
             logger.debug(traceback.format_exc())
             logger.error(
-                f"Request Validation Error parsing payload [{json_request}]. IngestionPipeline expected: {err}"
+                f"Request Validation Error parsing payload [{body}]. IngestionPipeline expected: {err}"
             )
             return ApiResponse.error(
                 status=ApiResponse.STATUS_BAD_REQUEST,
@@ -80,7 +121,7 @@ def get_fn(blueprint: Blueprint) -> Callable:
 
         except Exception as exc:
             logger.debug(traceback.format_exc())
-            logger.error(f"Internal error deploying [{json_request}] due to [{exc}] ")
+            logger.error(f"Internal error deploying [{body}] due to [{exc}] ")
             return ApiResponse.error(
                 status=ApiResponse.STATUS_SERVER_ERROR,
                 error=f"Internal error while deploying due to [{exc}] ",
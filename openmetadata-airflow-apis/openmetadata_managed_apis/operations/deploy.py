@@ -66,7 +66,7 @@ class DagDeployer:
         self.dag_id = clean_dag_id(self.ingestion_pipeline.name.__root__)
 
     def store_airflow_pipeline_config(
-        self, dag_config_file_path: Path
+        self, dag_config_file_path: Path, pipeline_config: str
     ) -> Dict[str, str]:
         """
         Store the airflow pipeline config in a JSON file and
@@ -75,10 +75,31 @@ class DagDeployer:
 
         logger.info(f"Saving file to {dag_config_file_path}")
         with open(dag_config_file_path, "w") as outfile:
-            outfile.write(self.ingestion_pipeline.json(encoder=show_secrets_encoder))
+            outfile.write(pipeline_config)
 
         return {"workflow_config_file": str(dag_config_file_path)}
 
+    @staticmethod
+    def remove_airflow_pipeline_config(dag_config_file_path: Path) -> None:
+        """
+        Remove the config file of a failed deploy, so
+        that retrying it is not skipped as already deployed
+        """
+        if dag_config_file_path.is_file():
+            logger.info(f"Removing file {dag_config_file_path}")
+            dag_config_file_path.unlink()
+
+    @staticmethod
+    def render_dag(dag_runner_config: Dict[str, str]) -> str:
+        """
+        Render the Python file generating the DAG
+        from the dag runner template
+        """
+        raw_template = pkgutil.get_data(PLUGIN_NAME, "resources/dag_runner.j2").decode()
+        template = Template(raw_template, autoescape=True)
+
+        return template.render(dag_runner_config)
+
     def store_and_validate_dag_file(self, dag_runner_config: Dict[str, str]) -> str:
         """
         Stores the Python file generating the DAG and returns
@@ -87,11 +108,7 @@ class DagDeployer:
 
         dag_py_file = Path(AIRFLOW_DAGS_FOLDER) / f"{self.dag_id}.py"
 
-        # Open the template and render
-        raw_template = pkgutil.get_data(PLUGIN_NAME, "resources/dag_runner.j2").decode()
-        template = Template(raw_template, autoescape=True)
-
-        rendered_dag = template.render(dag_runner_config)
+        rendered_dag = self.render_dag(dag_runner_config)
 
         # Create the DAGs path if it does not exist
         if not dag_py_file.parent.is_dir():
@@ -149,6 +166,25 @@ class DagDeployer:
             {"message": f"Workflow [{escape(self.dag_id)}] has been created"}
         )
 
+    def is_deployed(self, dag_config_file_path: Path, pipeline_config: str) -> bool:
+        """
+        Check if the stored config file already holds this exact
+        configuration and the DAG file matches the current template.
+
+        The config file is only left in place by successful deploys.
+        """
+        dag_py_file = Path(AIRFLOW_DAGS_FOLDER) / f"{self.dag_id}.py"
+        if not (dag_py_file.is_file() and dag_config_file_path.is_file()):
+            return False
+
+        rendered_dag = self.render_dag(
+            {"workflow_config_file": str(dag_config_file_path)}
+        )
+        return (
+            dag_config_file_path.read_text() == pipeline_config
+            and dag_py_file.read_text() == rendered_dag
+        )
+
     def deploy(self):
         """
         Run all methods to deploy the DAG
@@ -156,8 +192,24 @@ class DagDeployer:
         dag_config_file_path = Path(DAG_GENERATED_CONFIGS) / f"{self.dag_id}.json"
         logger.info(f"Config file under {dag_config_file_path}")
 
-        dag_runner_config = self.store_airflow_pipeline_config(dag_config_file_path)
-        dag_py_file = self.store_and_validate_dag_file(dag_runner_config)
-        response = self.refresh_session_dag(dag_py_file)
+        pipeline_config = self.ingestion_pipeline.json(encoder=show_secrets_encoder)
+        if self.is_deployed(dag_config_file_path, pipeline_config):
+            logger.info(f"Workflow [{self.dag_id}] is already deployed. Skipping.")
+            return ApiResponse.success(
+                {"message": f"Workflow [{escape(self.dag_id)}] is already deployed"}
+            )
+
+        dag_runner_config = self.store_airflow_pipeline_config(
+            dag_config_file_path, pipeline_config
+        )
+        try:
+            dag_py_file = self.store_and_validate_dag_file(dag_runner_config)
+            response = self.refresh_session_dag(dag_py_file)
+        except Exception:
+            self.remove_airflow_pipeline_config(dag_config_file_path)
+            raise
+
+        if response.status_code != ApiResponse.STATUS_OK:
+            self.remove_airflow_pipeline_config(dag_config_file_path)
 
         return response
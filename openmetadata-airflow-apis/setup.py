@@ -53,6 +53,7 @@ base_requirements = {
     "apache-airflow>=2.2.2",
     "Flask>=1.1.4",
     "Flask-Admin==1.6.0",
+    "orjson~=3.8",
 }
 
 dev_requirements = {
@@ -18,6 +18,7 @@ import time
 import uuid
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 # We need to patch the environment before importing Airflow
 # At module load it already inits the configurations.
@@ -69,6 +70,7 @@ from airflow.operators.bash import BashOperator
 from airflow.utils import timezone
 from airflow.utils.state import DagRunState
 from airflow.utils.types import DagRunType
+from openmetadata_managed_apis.api.response import ApiResponse
 from openmetadata_managed_apis.operations.delete import delete_dag_id
 from openmetadata_managed_apis.operations.deploy import DagDeployer
 from openmetadata_managed_apis.operations.kill_all import kill_all
@@ -208,9 +210,9 @@ class TestAirflowOps(TestCase):
         self.assertEqual(res.status_code, 200)
         self.assertEqual(res.json, {"message": "DAG dag_status has been disabled"})
 
-    def test_dag_deploy_and_delete(self):
+    def get_ingestion_pipeline(self, name: str) -> IngestionPipeline:
         """
-        DAGs can be deployed
+        Prepare an ingestion pipeline for the test service
         """
         service = self.metadata.create_or_update(
             CreateDatabaseServiceRequest(
@@ -228,12 +230,12 @@ class TestAirflowOps(TestCase):
             )
         )
 
-        ingestion_pipeline = IngestionPipeline(
+        return IngestionPipeline(
             id=uuid.uuid4(),
             pipelineType=PipelineType.metadata,
-            name="my_new_dag",
+            name=name,
             description=Markdown(__root__="A test DAG"),
-            fullyQualifiedName="test-service-ops.my_new_dag",
+            fullyQualifiedName=f"test-service-ops.{name}",
             sourceConfig=SourceConfig(config=DatabaseServiceMetadataPipeline()),
             openMetadataServerConnection=self.conn,
             airflowConfig=AirflowConfig(),
@@ -242,6 +244,12 @@ class TestAirflowOps(TestCase):
             ),
         )
 
+    def test_dag_deploy_and_delete(self):
+        """
+        DAGs can be deployed
+        """
+        ingestion_pipeline = self.get_ingestion_pipeline(name="my_new_dag")
+
         # Create the DAG
         deployer = DagDeployer(ingestion_pipeline)
         res = deployer.deploy()
@@ -254,6 +262,14 @@ class TestAirflowOps(TestCase):
         dag_file = Path("/tmp/airflow/dags/my_new_dag.py")
         self.assertTrue(dag_file.is_file())
 
+        # Deploying the same configuration again is a no-op
+        res = DagDeployer(ingestion_pipeline).deploy()
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            res.json, {"message": "Workflow [my_new_dag] is already deployed"}
+        )
+
         # Trigger it, waiting for it to be parsed by the scheduler
         dag_id = "my_new_dag"
         tries = 5
@@ -279,3 +295,30 @@ class TestAirflowOps(TestCase):
         # Cannot find it anymore
         res = status(dag_id="my_new_dag")
         self.assertEqual(res.status_code, 404)
+
+    def test_dag_deploy_retry(self):
+        """
+        A failed deploy is not skipped when retried
+        """
+        ingestion_pipeline = self.get_ingestion_pipeline(name="my_failed_dag")
+
+        with patch.object(
+            DagDeployer,
+            "refresh_session_dag",
+            return_value=ApiResponse.server_error({"message": "Refresh failed"}),
+        ):
+            res = DagDeployer(ingestion_pipeline).deploy()
+
+        self.assertEqual(res.status_code, 500)
+        self.assertFalse(Path("/tmp/airflow/my_failed_dag.json").is_file())
+
+        # Retrying the same configuration deploys it
+        res = DagDeployer(ingestion_pipeline).deploy()
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            res.json, {"message": "Workflow [my_failed_dag] has been created"}
+        )
+
+        res = delete_dag_id("my_failed_dag")
+        self.assertEqual(res.status_code, 200)
@@ -0,0 +1,123 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the parsing of the deploy requests
+"""
+import uuid
+from unittest import TestCase
+from unittest.mock import patch
+
+import orjson
+from openmetadata_managed_apis.api.routes import deploy
+from openmetadata_managed_apis.api.routes.deploy import (
+    INGESTION_PIPELINE_CACHE_SIZE,
+    parse_ingestion_pipeline,
+)
+from pydantic import ValidationError
+
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.entity.services.ingestionPipelines.ingestionPipeline import (
+    AirflowConfig,
+    IngestionPipeline,
+    PipelineType,
+)
+from metadata.generated.schema.metadataIngestion.databaseServiceMetadataPipeline import (
+    DatabaseServiceMetadataPipeline,
+)
+from metadata.generated.schema.metadataIngestion.workflow import SourceConfig
+from metadata.ingestion.models.encoders import show_secrets_encoder
+from metadata.utils.lru_cache import LRUCache
+
+
+def get_body(name: str) -> bytes:
+    """
+    Prepare the deploy request body of an ingestion pipeline
+    """
+    return (
+        IngestionPipeline(
+            id=uuid.uuid4(),
+            pipelineType=PipelineType.metadata,
+            name=name,
+            fullyQualifiedName=f"test-service.{name}",
+            sourceConfig=SourceConfig(config=DatabaseServiceMetadataPipeline()),
+            openMetadataServerConnection=OpenMetadataConnection(
+                hostPort="http://localhost:8585/api",
+            ),
+            airflowConfig=AirflowConfig(),
+        )
+        .json(encoder=show_secrets_encoder)
+        .encode()
+    )
+
+
+class TestDeploy(TestCase):
+    """
+    Validate the cache of the parsed ingestion pipelines
+    """
+
+    def setUp(self) -> None:
+        cache_patcher = patch.object(
+            deploy,
+            "ingestion_pipeline_cache",
+            LRUCache(INGESTION_PIPELINE_CACHE_SIZE),
+        )
+        self.cache = cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    def test_parse_same_body(self):
+        """
+        Identical bodies return the cached pipeline
+        """
+        body = get_body("my_dag")
+
+        ingestion_pipeline = parse_ingestion_pipeline(body)
+
+        self.assertEqual(ingestion_pipeline.name.__root__, "my_dag")
+        self.assertIs(parse_ingestion_pipeline(body), ingestion_pipeline)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_parse_different_body(self):
+        """
+        Different bodies are parsed on their own
+        """
+        ingestion_pipeline = parse_ingestion_pipeline(get_body("my_dag"))
+        other_pipeline = parse_ingestion_pipeline(get_body("my_other_dag"))
+
+        self.assertIsNot(other_pipeline, ingestion_pipeline)
+        self.assertEqual(other_pipeline.name.__root__, "my_other_dag")
+        self.assertEqual(len(self.cache), 2)
+
+    def test_parse_eviction(self):
+        """
+        The least recently parsed pipelines are evicted
+        """
+        first_body = get_body("my_dag_0")
+        first_pipeline = parse_ingestion_pipeline(first_body)
+
+        for idx in range(1, INGESTION_PIPELINE_CACHE_SIZE + 1):
+            parse_ingestion_pipeline(get_body(f"my_dag_{idx}"))
+
+        self.assertEqual(len(self.cache), INGESTION_PIPELINE_CACHE_SIZE)
+        self.assertIsNot(parse_ingestion_pipeline(first_body), first_pipeline)
+
+    def test_parse_errors(self):
+        """
+        Invalid bodies still raise and are not cached
+        """
+        self.assertRaises(
+            orjson.JSONDecodeError, parse_ingestion_pipeline, b"{not a json"
+        )
+        self.assertRaises(
+            ValidationError, parse_ingestion_pipeline, b'{"name": "my_dag"}'
+        )
+        self.assertEqual(len(self.cache), 0)